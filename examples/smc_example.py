@@ -17,15 +17,38 @@ Copyright (C) 2025 Timothy Deters / R.E.C.A.L.L. Foundation
 This file is part of the ACD Specification.
 """
 
+import os
 import sys
-import json
-from pathlib import Path
+from typing import Any, List
 
 # Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
 
 from smc_coordinator import SMCCoordinator, GlobalStatus, AgentState, QueueStatus
-from example_agents import ReasoningAgent, TesterAgent, FinalizerAgent, BuilderAgent
+from example_agents import get_agent
+
+# Use orjson for pretty-printing when available, stdlib json otherwise
+try:
+    import orjson
+
+    def _pp(obj: Any) -> str:
+        """Serialize obj as 2-space indented JSON"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _pp(obj: Any) -> str:
+        """Serialize obj as 2-space indented JSON"""
+        return json.dumps(obj, indent=2)
+
+
+_BAR = "=" * 80
+_DASH = "-" * 80
+
+
+def _banner(out: List[str], title: str) -> None:
+    """Append a section banner for title to the demo output buffer"""
+    out.extend((_BAR, title, _BAR, ""))
 
 
 def demo_basic_coordination():
@@ -37,19 +60,17 @@ def demo_basic_coordination():
     AI_COMPLEXITY: MEDIUM
     AI_NOTE: Shows simple coordination loop
     """
-    print("=" * 80)
-    print("SMC Coordinator - Basic Coordination Demo")
-    print("=" * 80)
-    print()
+    out = []
+    _banner(out, "SMC Coordinator - Basic Coordination Demo")
     
-    # Initialize coordinator
-    coordinator = SMCCoordinator()
+    # Initialize coordinator, keeping status snapshots in the execution log
+    coordinator = SMCCoordinator(log_status_snapshots=True)
     
     # Register agents
-    coordinator.register_agent("ReasoningAgent", ReasoningAgent())
-    coordinator.register_agent("TesterAgent", TesterAgent())
-    coordinator.register_agent("FinalizerAgent", FinalizerAgent())
-    coordinator.register_agent("BuilderAgent", BuilderAgent())
+    coordinator.register_agent("ReasoningAgent", get_agent("ReasoningAgent"))
+    coordinator.register_agent("TesterAgent", get_agent("TesterAgent"))
+    coordinator.register_agent("FinalizerAgent", get_agent("FinalizerAgent"))
+    coordinator.register_agent("BuilderAgent", get_agent("BuilderAgent"))
     
     # Set up initial state with some errors
     coordinator.global_status.top_errors = [
@@ -60,30 +81,27 @@ def demo_basic_coordination():
     coordinator.global_status.ai_state = AgentState.READY
     coordinator.global_status.ai_handoff_requested = True
     
-    print("Initial Global Status:")
-    print(json.dumps(coordinator.global_status.to_dict(), indent=2))
-    print()
+    out.append("Initial Global Status:")
+    out.append(_pp(coordinator.global_status.to_dict()))
+    out.append("")
     
     # Run coordination loop
-    print("Running coordination loop...")
-    print()
+    out.append("Running coordination loop...")
+    out.append("")
     result = coordinator.run_coordination_loop(max_iterations=5)
     
     # Print results
-    print("=" * 80)
-    print("Coordination Results")
-    print("=" * 80)
-    print()
-    print(f"Total Iterations: {result['total_iterations']}")
-    print()
-    print("Final State:")
-    print(json.dumps(result['final_state'], indent=2))
-    print()
-    print("Execution Log:")
-    for entry in result['execution_log']:
-        print("-" * 80)
-        print(json.dumps(entry, indent=2))
-    print()
+    _banner(out, "Coordination Results")
+    out.append(f"Total Iterations: {result['total_iterations']}")
+    out.append("")
+    out.append("Final State:")
+    out.append(_pp(result['final_state']))
+    out.append("")
+    out.append("Execution Log:")
+    out.extend(f"{_DASH}\n{_pp(entry)}" for entry in result['execution_log'])
+    out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def demo_routing_prompt():
@@ -95,29 +113,29 @@ def demo_routing_prompt():
     AI_COMPLEXITY: LOW
     AI_NOTE: Shows routing prompt structure
     """
-    print("=" * 80)
-    print("SMC Coordinator - State Routing Prompt Demo")
-    print("=" * 80)
-    print()
+    out = []
+    _banner(out, "SMC Coordinator - State Routing Prompt Demo")
     
     coordinator = SMCCoordinator()
-    coordinator.register_agent("ReasoningAgent", ReasoningAgent())
-    coordinator.register_agent("TesterAgent", TesterAgent())
-    coordinator.register_agent("FinalizerAgent", FinalizerAgent())
+    coordinator.register_agent("ReasoningAgent", get_agent("ReasoningAgent"))
+    coordinator.register_agent("TesterAgent", get_agent("TesterAgent"))
+    coordinator.register_agent("FinalizerAgent", get_agent("FinalizerAgent"))
     
     # Generate routing prompt
     prompt = coordinator.state_routing_prompt(coordinator.global_status)
     
-    print("State Routing Prompt:")
-    print(prompt)
-    print()
+    out.append("State Routing Prompt:")
+    out.append(prompt)
+    out.append("")
     
     # Execute routing
     decision = coordinator.execute_routing()
-    print("Routing Decision:")
-    print(f"  Next Agent: {decision.next_agent}")
-    print(f"  Rationale: {decision.rationale}")
-    print()
+    out.append("Routing Decision:")
+    out.append(f"  Next Agent: {decision.next_agent}")
+    out.append(f"  Rationale: {decision.rationale}")
+    out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def demo_triage_prompt():
@@ -129,10 +147,8 @@ def demo_triage_prompt():
     AI_COMPLEXITY: LOW
     AI_NOTE: Shows triage prompt structure
     """
-    print("=" * 80)
-    print("SMC Coordinator - Fix Triage Prompt Demo")
-    print("=" * 80)
-    print()
+    out = []
+    _banner(out, "SMC Coordinator - Fix Triage Prompt Demo")
     
     coordinator = SMCCoordinator()
     
@@ -148,16 +164,18 @@ def demo_triage_prompt():
     # Generate triage prompt
     prompt = coordinator.fix_triage_prompt(errors)
     
-    print("Fix Triage Prompt:")
-    print(prompt)
-    print()
+    out.append("Fix Triage Prompt:")
+    out.append(prompt)
+    out.append("")
     
     # Execute triage
     decision = coordinator.execute_triage(errors)
-    print("Triage Decision:")
-    print(f"  Action: {decision.action}")
-    print(f"  Context Focus: {decision.context_focus}")
-    print()
+    out.append("Triage Decision:")
+    out.append(f"  Action: {decision.action}")
+    out.append(f"  Context Focus: {decision.context_focus}")
+    out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def demo_final_decision_prompt():
@@ -169,41 +187,44 @@ def demo_final_decision_prompt():
     AI_COMPLEXITY: LOW
     AI_NOTE: Shows final decision prompt structure
     """
-    print("=" * 80)
-    print("SMC Coordinator - Final Decision Prompt Demo")
-    print("=" * 80)
-    print()
+    out = []
+    _banner(out, "SMC Coordinator - Final Decision Prompt Demo")
     
     coordinator = SMCCoordinator()
     
     # Scenario 1: High success rates
-    print("Scenario 1: High Success Rates")
+    out.append("Scenario 1: High Success Rates")
     coordinator.global_status.build_success_rate = 0.98
     coordinator.global_status.test_success_rate = 0.95
     
-    prompt = coordinator.final_decision_prompt(0.98, 0.95)
-    print("Final Decision Prompt:")
-    print(prompt)
-    print()
+    prompt = coordinator.final_decision_prompt(
+        coordinator.global_status.build_success_rate,
+        coordinator.global_status.test_success_rate
+    )
+    out.append("Final Decision Prompt:")
+    out.append(prompt)
+    out.append("")
     
     decision = coordinator.execute_final_decision()
-    print("Final Decision:")
-    print(f"  Commit Required: {decision.commit_required}")
-    print(f"  Next Agent: {decision.next_agent}")
-    print(f"  Rationale: {decision.rationale}")
-    print()
+    out.append("Final Decision:")
+    out.append(f"  Commit Required: {decision.commit_required}")
+    out.append(f"  Next Agent: {decision.next_agent}")
+    out.append(f"  Rationale: {decision.rationale}")
+    out.append("")
     
     # Scenario 2: Low success rates
-    print("Scenario 2: Low Success Rates")
+    out.append("Scenario 2: Low Success Rates")
     coordinator.global_status.build_success_rate = 0.75
     coordinator.global_status.test_success_rate = 0.80
     
     decision = coordinator.execute_final_decision()
-    print("Final Decision:")
-    print(f"  Commit Required: {decision.commit_required}")
-    print(f"  Next Agent: {decision.next_agent}")
-    print(f"  Rationale: {decision.rationale}")
-    print()
+    out.append("Final Decision:")
+    out.append(f"  Commit Required: {decision.commit_required}")
+    out.append(f"  Next Agent: {decision.next_agent}")
+    out.append(f"  Rationale: {decision.rationale}")
+    out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def demo_agent_structured_output():
@@ -215,10 +236,8 @@ def demo_agent_structured_output():
     AI_COMPLEXITY: LOW
     AI_NOTE: Shows structured JSON output from agents
     """
-    print("=" * 80)
-    print("Agent Structured Output Demo")
-    print("=" * 80)
-    print()
+    out = []
+    _banner(out, "Agent Structured Output Demo")
     
     # Create global status with errors
     global_status = GlobalStatus(
@@ -235,38 +254,40 @@ def demo_agent_structured_output():
     )
     
     # Test ReasoningAgent
-    print("ReasoningAgent Structured Output:")
-    print("-" * 80)
-    reasoning_agent = ReasoningAgent()
+    out.append("ReasoningAgent Structured Output:")
+    out.append(_DASH)
+    reasoning_agent = get_agent("ReasoningAgent")
     result = reasoning_agent.execute(global_status)
-    print(json.dumps(result, indent=2))
-    print()
+    out.append(_pp(result))
+    out.append("")
     
     # Test TesterAgent
-    print("TesterAgent Structured Output:")
-    print("-" * 80)
-    tester_agent = TesterAgent()
+    out.append("TesterAgent Structured Output:")
+    out.append(_DASH)
+    tester_agent = get_agent("TesterAgent")
     result = tester_agent.execute(global_status)
-    print(json.dumps(result, indent=2))
-    print()
+    out.append(_pp(result))
+    out.append("")
     
     # Test BuilderAgent
-    print("BuilderAgent Structured Output:")
-    print("-" * 80)
-    builder_agent = BuilderAgent()
+    out.append("BuilderAgent Structured Output:")
+    out.append(_DASH)
+    builder_agent = get_agent("BuilderAgent")
     result = builder_agent.execute(global_status)
-    print(json.dumps(result, indent=2))
-    print()
+    out.append(_pp(result))
+    out.append("")
     
     # Test FinalizerAgent with good metrics
-    print("FinalizerAgent Structured Output (Success Case):")
-    print("-" * 80)
+    out.append("FinalizerAgent Structured Output (Success Case):")
+    out.append(_DASH)
     global_status.build_success_rate = 0.98
     global_status.test_success_rate = 0.95
-    finalizer_agent = FinalizerAgent()
+    finalizer_agent = get_agent("FinalizerAgent")
     result = finalizer_agent.execute(global_status)
-    print(json.dumps(result, indent=2))
-    print()
+    out.append(_pp(result))
+    out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def demo_complete_workflow():
@@ -278,98 +299,106 @@ def demo_complete_workflow():
     AI_COMPLEXITY: HIGH
     AI_NOTE: Shows complete workflow from error to finalization
     """
-    print("=" * 80)
-    print("Complete Autonomous Development Workflow")
-    print("=" * 80)
-    print()
+    out = []
+    _banner(out, "Complete Autonomous Development Workflow")
     
     # Initialize coordinator
     coordinator = SMCCoordinator()
     
     # Register agents
-    coordinator.register_agent("BuilderAgent", BuilderAgent())
-    coordinator.register_agent("ReasoningAgent", ReasoningAgent())
-    coordinator.register_agent("TesterAgent", TesterAgent())
-    coordinator.register_agent("FinalizerAgent", FinalizerAgent())
+    coordinator.register_agent("BuilderAgent", get_agent("BuilderAgent"))
+    coordinator.register_agent("ReasoningAgent", get_agent("ReasoningAgent"))
+    coordinator.register_agent("TesterAgent", get_agent("TesterAgent"))
+    coordinator.register_agent("FinalizerAgent", get_agent("FinalizerAgent"))
     
     # Simulate workflow stages
-    print("Stage 1: Initial Build")
-    print("-" * 80)
+    out.append("Stage 1: Initial Build")
+    out.append(_DASH)
     coordinator.global_status.ai_state = AgentState.READY
     coordinator.global_status.ai_queue_status = QueueStatus.QUEUED
     coordinator.global_status.last_action = "INIT"
     
     # Build phase (simulated success)
-    builder_agent = BuilderAgent()
+    builder_agent = get_agent("BuilderAgent")
     build_result = builder_agent.execute(coordinator.global_status)
-    print("Build Result:")
-    print(json.dumps(build_result, indent=2))
+    out.append("Build Result:")
+    out.append(_pp(build_result))
     coordinator._update_status_from_result(build_result, "BuilderAgent")
-    print()
+    out.append("")
     
-    print("Stage 2: Testing")
-    print("-" * 80)
-    tester_agent = TesterAgent()
+    out.append("Stage 2: Testing")
+    out.append(_DASH)
+    tester_agent = get_agent("TesterAgent")
     test_result = tester_agent.execute(coordinator.global_status)
-    print("Test Result:")
-    print(json.dumps(test_result, indent=2))
+    out.append("Test Result:")
+    out.append(_pp(test_result))
     coordinator._update_status_from_result(test_result, "TesterAgent")
-    print()
+    out.append("")
     
-    print("Stage 3: Error Analysis (if needed)")
-    print("-" * 80)
+    out.append("Stage 3: Error Analysis (if needed)")
+    out.append(_DASH)
     if coordinator.global_status.test_success_rate < 1.0:
-        reasoning_agent = ReasoningAgent()
+        reasoning_agent = get_agent("ReasoningAgent")
         reason_result = reasoning_agent.execute(coordinator.global_status)
-        print("Reasoning Result:")
-        print(json.dumps(reason_result, indent=2))
+        out.append("Reasoning Result:")
+        out.append(_pp(reason_result))
         coordinator._update_status_from_result(reason_result, "ReasoningAgent")
     else:
-        print("No errors detected, skipping reasoning phase")
-    print()
+        out.append("No errors detected, skipping reasoning phase")
+    out.append("")
     
-    print("Stage 4: Finalization")
-    print("-" * 80)
+    out.append("Stage 4: Finalization")
+    out.append(_DASH)
     # Set success rates for finalization
     coordinator.global_status.build_success_rate = 0.98
     coordinator.global_status.test_success_rate = 0.95
     
-    finalizer_agent = FinalizerAgent()
+    finalizer_agent = get_agent("FinalizerAgent")
     final_result = finalizer_agent.execute(coordinator.global_status)
-    print("Finalization Result:")
-    print(json.dumps(final_result, indent=2))
-    print()
+    out.append("Finalization Result:")
+    out.append(_pp(final_result))
+    out.append("")
     
-    print("Final Global Status:")
-    print(json.dumps(coordinator.global_status.to_dict(), indent=2))
-    print()
+    out.append("Final Global Status:")
+    out.append(_pp(coordinator.global_status.to_dict()))
+    out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+DEMOS = (
+    ("Basic Coordination", demo_basic_coordination),
+    ("State Routing Prompt", demo_routing_prompt),
+    ("Fix Triage Prompt", demo_triage_prompt),
+    ("Final Decision Prompt", demo_final_decision_prompt),
+    ("Agent Structured Output", demo_agent_structured_output),
+    ("Complete Workflow", demo_complete_workflow),
+)
+
+# Lowercased names for argv lookup, computed once
+_DEMOS_LOWER = tuple((name.lower(), func) for name, func in DEMOS)
+_DEMO_BY_NAME = dict(_DEMOS_LOWER)
 
 
 def main():
     """Main entry point for demos"""
-    demos = [
-        ("Basic Coordination", demo_basic_coordination),
-        ("State Routing Prompt", demo_routing_prompt),
-        ("Fix Triage Prompt", demo_triage_prompt),
-        ("Final Decision Prompt", demo_final_decision_prompt),
-        ("Agent Structured Output", demo_agent_structured_output),
-        ("Complete Workflow", demo_complete_workflow),
-    ]
-    
     if len(sys.argv) > 1:
-        # Run specific demo
+        # Run specific demo: exact name first, then substring match
         demo_name = sys.argv[1]
-        for name, func in demos:
-            if demo_name.lower() in name.lower():
-                func()
-                return
+        key = demo_name.lower()
+        func = _DEMO_BY_NAME.get(key)
+        if func is None:
+            func = next((f for name, f in _DEMOS_LOWER if key in name), None)
+        if func is not None:
+            func()
+            return
         print(f"Demo '{demo_name}' not found")
         print("Available demos:")
-        for name, _ in demos:
+        for name, _ in DEMOS:
             print(f"  - {name}")
     else:
         # Run all demos
-        for i, (name, func) in enumerate(demos):
+        for i, (name, func) in enumerate(DEMOS):
             if i > 0:
                 print("\n" * 3)
             func()
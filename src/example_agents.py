@@ -16,10 +16,163 @@ Copyright (C) 2025 Timothy Deters / R.E.C.A.L.L. Foundation
 This file is part of the ACD Specification.
 """
 
+from functools import lru_cache
 from typing import Dict, Any
 from abc import ABC, abstractmethod
 
 
+# AI_STATE / AI_QUEUE_STATUS values used in agent payloads, bound once so
+# every payload shares the same string objects
+_S_PROCESSING = "PROCESSING"
+_S_READY = "READY"
+_S_DONE = "DONE"
+_S_BLOCKED = "BLOCKED"
+
+_Q_IN_PROGRESS = "IN_PROGRESS"
+_Q_REVIEW_PENDING = "REVIEW_PENDING"
+_Q_APPROVED = "APPROVED"
+_Q_REJECTED = "REJECTED"
+_Q_COMPLETED = "COMPLETED"
+
+# Fix payload templates for ReasoningAgent._generate_fix, keyed by error kind
+_FIX_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "syntax": {
+        "fix_type": "SYNTAX_CORRECTION",
+        "target_file": "unknown.py",
+        "line_number": 0,
+        "error_type": "SYNTAX",
+        "suggested_fix": "Check for missing parentheses or quotes",
+        "confidence": 0.7
+    },
+    "imp": {
+        "fix_type": "ADD_IMPORT",
+        "target_file": "unknown.py",
+        "line_number": 1,
+        "error_type": "IMPORT",
+        "new_code": "# Add missing import statement",
+        "confidence": 0.8
+    },
+    "undef": {
+        "fix_type": "DEFINE_VARIABLE",
+        "target_file": "unknown.py",
+        "line_number": 0,
+        "error_type": "UNDEFINED",
+        "suggested_fix": "Initialize variable before use",
+        "confidence": 0.75
+    }
+}
+
+_MANUAL_TEMPLATE: Dict[str, Any] = {
+    "fix_type": "MANUAL_REVIEW",
+    "target_file": "unknown.py",
+    "line_number": 0,
+    "error_type": "UNKNOWN",
+    "suggested_fix": "Requires manual investigation",
+    "confidence": 0.5
+}
+
+# Invariant parts of the agent payloads, built once at import. execute()
+# merges only the per-call fields into a fresh dict.
+_REASONING_DONE_PAYLOAD: Dict[str, Any] = {
+    "action": "ANALYZE",
+    "result": "SUCCESS",
+    "ai_state": _S_DONE,
+    "ai_queue_status": _Q_COMPLETED,
+    "ai_handoff_requested": False,
+    "analysis": "No errors found, system is healthy"
+}
+
+_REASONING_LAST_FIX_PAYLOAD: Dict[str, Any] = {
+    "action": "REASON_AND_FIX",
+    "result": "SUCCESS",
+    "ai_state": _S_READY,
+    "ai_queue_status": _Q_REVIEW_PENDING,
+    "ai_handoff_requested": True
+}
+
+_REASONING_MORE_FIXES_PAYLOAD: Dict[str, Any] = {
+    "action": "REASON_AND_FIX",
+    "result": "SUCCESS",
+    "ai_state": _S_PROCESSING,
+    "ai_queue_status": _Q_IN_PROGRESS,
+    "ai_handoff_requested": False
+}
+
+_TESTER_APPROVED_PAYLOAD: Dict[str, Any] = {
+    "action": "RUN_TESTS",
+    "result": "SUCCESS",
+    "ai_state": _S_READY,
+    "ai_queue_status": _Q_APPROVED,
+    "ai_handoff_requested": True
+}
+
+_TESTER_IN_PROGRESS_PAYLOAD: Dict[str, Any] = {
+    "action": "RUN_TESTS",
+    "result": "PARTIAL",
+    "ai_state": _S_PROCESSING,
+    "ai_queue_status": _Q_IN_PROGRESS,
+    "ai_handoff_requested": True  # Need reasoning agent
+}
+
+_TESTER_REJECTED_PAYLOAD: Dict[str, Any] = {
+    "action": "RUN_TESTS",
+    "result": "PARTIAL",
+    "ai_state": _S_BLOCKED,
+    "ai_queue_status": _Q_REJECTED,
+    "ai_handoff_requested": True  # Definitely need help
+}
+
+# Indexed by (success_rate >= 0.50) + (success_rate >= 0.90)
+_TESTER_PAYLOADS = (
+    _TESTER_REJECTED_PAYLOAD,
+    _TESTER_IN_PROGRESS_PAYLOAD,
+    _TESTER_APPROVED_PAYLOAD
+)
+
+_FINALIZER_READY_PAYLOAD: Dict[str, Any] = {
+    "action": "FINALIZE",
+    "result": "SUCCESS",
+    "ai_state": _S_DONE,
+    "ai_queue_status": _Q_COMPLETED,
+    "ai_handoff_requested": False,
+    "commit_ready": True,
+    "commit_message": "Autonomous development cycle completed successfully"
+}
+
+_FINALIZER_BLOCKED_PAYLOAD: Dict[str, Any] = {
+    "action": "FINALIZE",
+    "result": "FAILURE",
+    "ai_state": _S_BLOCKED,
+    "ai_queue_status": _Q_REJECTED,
+    "ai_handoff_requested": True,
+    "commit_ready": False,
+    "reason": "Success rates below threshold",
+    "build_success_rate": None,  # Filled per call
+    "test_success_rate": None,  # Filled per call
+    "required_build_rate": 0.95,
+    "required_test_rate": 0.90
+}
+
+# Indexed by whether both success rates meet their thresholds
+_FINALIZER_PAYLOADS = (_FINALIZER_BLOCKED_PAYLOAD, _FINALIZER_READY_PAYLOAD)
+
+_BUILDER_SUCCESS_PAYLOAD: Dict[str, Any] = {
+    "action": "BUILD",
+    "result": "SUCCESS",
+    "ai_state": _S_READY,
+    "ai_queue_status": _Q_COMPLETED,
+    "ai_handoff_requested": True  # Move to tester
+}
+
+_BUILDER_FAILURE_PAYLOAD: Dict[str, Any] = {
+    "action": "BUILD",
+    "result": "FAILURE",
+    "ai_state": _S_BLOCKED,
+    "ai_queue_status": _Q_REJECTED,
+    "ai_handoff_requested": True  # Need reasoning agent
+}
+
+
 class BaseAgent(ABC):
     """
     Base class for all agents in the SMC system.
@@ -32,6 +185,8 @@ class BaseAgent(ABC):
     All agents must implement execute() method that returns structured JSON output.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def execute(self, global_status: Any) -> Dict[str, Any]:
         """
@@ -63,6 +218,8 @@ class ReasoningAgent(BaseAgent):
     {"fix_type": "INSERT_LINE", "target_file": "...", "new_code": "..."}
     """
     
+    __slots__ = ("name",)
+    
     def __init__(self):
         self.name = "ReasoningAgent"
     
@@ -82,18 +239,11 @@ class ReasoningAgent(BaseAgent):
             Structured output with fix recommendations
         """
         # Simulate reasoning about errors
-        errors = global_status.top_errors if hasattr(global_status, 'top_errors') else []
+        errors = global_status.top_errors
         
         if not errors:
             # No errors, mark as done
-            return {
-                "action": "ANALYZE",
-                "result": "SUCCESS",
-                "ai_state": "DONE",
-                "ai_queue_status": "COMPLETED",
-                "ai_handoff_requested": False,
-                "analysis": "No errors found, system is healthy"
-            }
+            return dict(_REASONING_DONE_PAYLOAD)
         
         # Analyze first error and generate fix
         error = errors[0] if errors else "Unknown error"
@@ -104,21 +254,13 @@ class ReasoningAgent(BaseAgent):
         # Determine if we need more iterations or can finalize
         if len(errors) <= 1:
             # Last error, can move to finalizer after fix
-            ai_state = "READY"
-            ai_handoff_requested = True
-            ai_queue_status = "REVIEW_PENDING"
+            payload = _REASONING_LAST_FIX_PAYLOAD
         else:
             # More errors to process
-            ai_state = "PROCESSING"
-            ai_handoff_requested = False
-            ai_queue_status = "IN_PROGRESS"
+            payload = _REASONING_MORE_FIXES_PAYLOAD
         
         return {
-            "action": "REASON_AND_FIX",
-            "result": "SUCCESS",
-            "ai_state": ai_state,
-            "ai_queue_status": ai_queue_status,
-            "ai_handoff_requested": ai_handoff_requested,
+            **payload,
             "fix_recommendation": fix_recommendation,
             "errors_remaining": len(errors) - 1
         }
@@ -139,43 +281,16 @@ class ReasoningAgent(BaseAgent):
             Structured fix recommendation
         """
         # Simple heuristic-based fix generation for demo
-        if "syntax error" in error.lower():
-            return {
-                "fix_type": "SYNTAX_CORRECTION",
-                "target_file": "unknown.py",
-                "line_number": 0,
-                "error_type": "SYNTAX",
-                "suggested_fix": "Check for missing parentheses or quotes",
-                "confidence": 0.7
-            }
-        elif "import" in error.lower():
-            return {
-                "fix_type": "ADD_IMPORT",
-                "target_file": "unknown.py",
-                "line_number": 1,
-                "error_type": "IMPORT",
-                "new_code": "# Add missing import statement",
-                "confidence": 0.8
-            }
-        elif "undefined" in error.lower() or "not defined" in error.lower():
-            return {
-                "fix_type": "DEFINE_VARIABLE",
-                "target_file": "unknown.py",
-                "line_number": 0,
-                "error_type": "UNDEFINED",
-                "suggested_fix": "Initialize variable before use",
-                "confidence": 0.75
-            }
+        lo = error.lower()
+        if "syntax error" in lo:
+            kind = "syntax"
+        elif "import" in lo:
+            kind = "imp"
+        elif "undefined" in lo or "not defined" in lo:
+            kind = "undef"
         else:
-            return {
-                "fix_type": "MANUAL_REVIEW",
-                "target_file": "unknown.py",
-                "line_number": 0,
-                "error_type": "UNKNOWN",
-                "suggested_fix": "Requires manual investigation",
-                "confidence": 0.5,
-                "error_message": error
-            }
+            return {**_MANUAL_TEMPLATE, "error_message": error}
+        return dict(_FIX_TEMPLATES[kind])
 
 
 class TesterAgent(BaseAgent):
@@ -189,6 +304,8 @@ class TesterAgent(BaseAgent):
     AI_DEPENDENCIES: AGENT_COORDINATION
     """
     
+    __slots__ = ("name",)
+    
     def __init__(self):
         self.name = "TesterAgent"
     
@@ -218,26 +335,11 @@ class TesterAgent(BaseAgent):
         # Collect errors
         errors = test_results["failures"]
         
-        # Determine next state
-        if success_rate >= 0.90:
-            ai_state = "READY"
-            ai_queue_status = "APPROVED"
-            ai_handoff_requested = True
-        elif success_rate >= 0.50:
-            ai_state = "PROCESSING"
-            ai_queue_status = "IN_PROGRESS"
-            ai_handoff_requested = True  # Need reasoning agent
-        else:
-            ai_state = "BLOCKED"
-            ai_queue_status = "REJECTED"
-            ai_handoff_requested = True  # Definitely need help
+        # Determine next state: rejected < 0.50 <= in progress < 0.90 <= approved
+        payload = _TESTER_PAYLOADS[(success_rate >= 0.50) + (success_rate >= 0.90)]
         
         return {
-            "action": "RUN_TESTS",
-            "result": "SUCCESS" if success_rate >= 0.90 else "PARTIAL",
-            "ai_state": ai_state,
-            "ai_queue_status": ai_queue_status,
-            "ai_handoff_requested": ai_handoff_requested,
+            **payload,
             "test_results": test_results,
             "test_success_rate": success_rate,
             "errors": errors
@@ -278,6 +380,8 @@ class FinalizerAgent(BaseAgent):
     AI_DEPENDENCIES: AGENT_COORDINATION
     """
     
+    __slots__ = ("name",)
+    
     def __init__(self):
         self.name = "FinalizerAgent"
     
@@ -297,37 +401,17 @@ class FinalizerAgent(BaseAgent):
             Structured output with finalization status
         """
         # Check if work is ready to finalize
-        build_success = getattr(global_status, 'build_success_rate', 0.0)
-        test_success = getattr(global_status, 'test_success_rate', 0.0)
+        build_success = global_status.build_success_rate
+        test_success = global_status.test_success_rate
         
-        if build_success >= 0.95 and test_success >= 0.90:
-            # Ready to commit
-            return {
-                "action": "FINALIZE",
-                "result": "SUCCESS",
-                "ai_state": "DONE",
-                "ai_queue_status": "COMPLETED",
-                "ai_handoff_requested": False,
-                "commit_ready": True,
-                "commit_message": "Autonomous development cycle completed successfully",
-                "build_success_rate": build_success,
-                "test_success_rate": test_success
-            }
-        else:
-            # Not ready yet, need more work
-            return {
-                "action": "FINALIZE",
-                "result": "FAILURE",
-                "ai_state": "BLOCKED",
-                "ai_queue_status": "REJECTED",
-                "ai_handoff_requested": True,
-                "commit_ready": False,
-                "reason": "Success rates below threshold",
-                "build_success_rate": build_success,
-                "test_success_rate": test_success,
-                "required_build_rate": 0.95,
-                "required_test_rate": 0.90
-            }
+        # Ready to commit only if both thresholds are met, otherwise more work
+        payload = _FINALIZER_PAYLOADS[build_success >= 0.95 and test_success >= 0.90]
+        
+        return {
+            **payload,
+            "build_success_rate": build_success,
+            "test_success_rate": test_success
+        }
 
 
 class BuilderAgent(BaseAgent):
@@ -341,6 +425,8 @@ class BuilderAgent(BaseAgent):
     AI_DEPENDENCIES: AGENT_COORDINATION
     """
     
+    __slots__ = ("name",)
+    
     def __init__(self):
         self.name = "BuilderAgent"
     
@@ -370,20 +456,13 @@ class BuilderAgent(BaseAgent):
         
         # Determine next state
         if build_results["status"] == "SUCCESS":
-            ai_state = "READY"
-            ai_queue_status = "COMPLETED"
-            ai_handoff_requested = True  # Move to tester
+            payload = _BUILDER_SUCCESS_PAYLOAD
         else:
-            ai_state = "BLOCKED"
-            ai_queue_status = "REJECTED"
-            ai_handoff_requested = True  # Need reasoning agent
+            payload = _BUILDER_FAILURE_PAYLOAD
         
         return {
-            "action": "BUILD",
+            **payload,
             "result": build_results["status"],
-            "ai_state": ai_state,
-            "ai_queue_status": ai_queue_status,
-            "ai_handoff_requested": ai_handoff_requested,
             "build_results": build_results,
             "build_success_rate": success_rate,
             "errors": errors
@@ -408,3 +487,30 @@ class BuilderAgent(BaseAgent):
             "warnings": 2,
             "errors": []
         }
+
+
+_AGENT_CLASSES = {
+    "ReasoningAgent": ReasoningAgent,
+    "TesterAgent": TesterAgent,
+    "FinalizerAgent": FinalizerAgent,
+    "BuilderAgent": BuilderAgent
+}
+
+
+@lru_cache(maxsize=None)
+def get_agent(name: str) -> BaseAgent:
+    """
+    Return the shared instance of an example agent.
+    
+    AI_PHASE: AGENT_IMPLEMENTATION
+    AI_STATUS: IMPLEMENTED
+    AI_COMPLEXITY: LOW
+    AI_NOTE: Example agents hold no per-run state, so one instance per class is reused
+    
+    Args:
+        name: Agent class name (e.g. "ReasoningAgent")
+        
+    Returns:
+        Cached agent instance
+    """
+    return _AGENT_CLASSES[name]()
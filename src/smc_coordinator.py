@@ -22,10 +22,43 @@ the Free Software Foundation, either version 3 of the License, or
 (at your option) any later version.
 """
 
-import json
-from typing import Dict, Any, List, Optional
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import asdict, dataclass, field
+
+# Use orjson's C encoder/decoder when available, stdlib json otherwise. The
+# fallback writes non-ASCII text unescaped like orjson; the backends still
+# differ on float exponents (1e-07 vs 1e-7), NaN (null under orjson), ints
+# beyond 64 bits (TypeError under orjson) and NaN in responses (orjson rejects)
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        """Serialize obj as compact JSON"""
+        return orjson.dumps(obj).decode()
+
+    def _dumps_indented(obj: Any) -> str:
+        """Serialize obj as 2-space indented JSON"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    _loads = orjson.loads
+    _C_ENCODER = True
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> str:
+        """Serialize obj as compact JSON"""
+        return json.dumps(obj, ensure_ascii=False)
+
+    def _dumps_indented(obj: Any) -> str:
+        """Serialize obj as 2-space indented JSON"""
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+    _loads = json.loads
+    _C_ENCODER = False
 
 
 class AgentState(Enum):
@@ -52,7 +85,21 @@ class QueueStatus(Enum):
     ABANDONED = "ABANDONED"
 
 
-@dataclass
+# Value -> member tables for decoding agent results without EnumMeta.__call__
+_AGENT_STATE_BY_VALUE = {member.value: member for member in AgentState}
+_QUEUE_STATUS_BY_VALUE = {member.value: member for member in QueueStatus}
+
+# Sentinel for optional agent result keys; distinguishes absent from None
+_MISSING = object()
+
+# States that end the coordination loop, with the reason logged for each
+_TERMINAL_REASONS = {
+    AgentState.DONE: "AI_STATE is DONE",
+    AgentState.FAILED: "AI_STATE is FAILED"
+}
+
+
+@dataclass(slots=True)
 class GlobalStatus:
     """
     AI_PHASE: AGENT_COORDINATION
@@ -69,21 +116,36 @@ class GlobalStatus:
     build_success_rate: float = 0.0
     test_success_rate: float = 0.0
     error_count: int = 0
-    top_errors: List[str] = None
+    top_errors: List[str] = field(default_factory=list)
     
     def __post_init__(self):
+        # An explicit top_errors=None still means "no errors"
         if self.top_errors is None:
             self.top_errors = []
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        result = asdict(self)
-        result['ai_state'] = self.ai_state.value
-        result['ai_queue_status'] = self.ai_queue_status.value
-        return result
+        """
+        Convert to dictionary for JSON serialization.
+        
+        The top_errors list is copied so snapshots do not change when agents
+        edit the live status. Enum values are read from ``_value_`` directly,
+        bypassing the ``value`` property descriptor.
+        """
+        return {
+            "last_action": self.last_action,
+            "last_agent": self.last_agent,
+            "last_result": self.last_result,
+            "ai_state": self.ai_state._value_,
+            "ai_queue_status": self.ai_queue_status._value_,
+            "ai_handoff_requested": self.ai_handoff_requested,
+            "build_success_rate": self.build_success_rate,
+            "test_success_rate": self.test_success_rate,
+            "error_count": self.error_count,
+            "top_errors": list(self.top_errors)
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutingDecision:
     """
     AI_PHASE: AGENT_COORDINATION
@@ -95,7 +157,7 @@ class RoutingDecision:
     rationale: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TriageDecision:
     """
     AI_PHASE: AGENT_COORDINATION
@@ -107,7 +169,7 @@ class TriageDecision:
     context_focus: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FinalDecision:
     """
     AI_PHASE: AGENT_COORDINATION
@@ -120,6 +182,220 @@ class FinalDecision:
     rationale: str
 
 
+# Constant parts of the coordinator prompts. Only the "input" block varies,
+# so each prompt is serialized once at import and split around the input slot.
+_ROUTING_TASK = "state_routing"
+_ROUTING_INSTRUCTION = "Determine the next agent to execute based on current state. Respond ONLY with valid JSON."
+_ROUTING_OUTPUT_FORMAT = MappingProxyType({
+    "next_agent": "string (one of available_agents or 'NONE')",
+    "rationale": "string (brief explanation)"
+})
+_ROUTING_CONSTRAINTS = (
+    "Response must be valid JSON",
+    "next_agent must be from available_agents or 'NONE'",
+    "rationale must be under 200 characters"
+)
+
+_TRIAGE_TASK = "fix_triage"
+_TRIAGE_INSTRUCTION = "Analyze errors and determine routing action. Respond ONLY with valid JSON."
+_TRIAGE_OUTPUT_FORMAT = MappingProxyType({
+    "action": "string (ROUTE_REASONER, ROUTE_TESTER, ROUTE_FINALIZER, or MANUAL_REVIEW)",
+    "context_focus": "string (area needing attention)"
+})
+_TRIAGE_CONSTRAINTS = (
+    "Response must be valid JSON",
+    "action must be one of: ROUTE_REASONER, ROUTE_TESTER, ROUTE_FINALIZER, MANUAL_REVIEW",
+    "context_focus must identify specific code area or phase"
+)
+
+_FINAL_TASK = "final_decision"
+_FINAL_INSTRUCTION = "Determine if work is ready to commit. Respond ONLY with valid JSON."
+_FINAL_OUTPUT_FORMAT = MappingProxyType({
+    "commit_required": "boolean",
+    "next_agent": "string (agent to handle next step)",
+    "rationale": "string (brief explanation)"
+})
+_FINAL_CONSTRAINTS = (
+    "Response must be valid JSON",
+    "commit_required based on thresholds",
+    "If commit_required is true, next_agent should be 'Finalizer'",
+    "If commit_required is false, next_agent should suggest remediation"
+)
+
+# Success rates required before work is committed
+_COMMIT_BUILD_THRESHOLD = 0.95
+_COMMIT_TEST_THRESHOLD = 0.90
+
+_INPUT_SLOT = "__INPUT__"
+
+def _split_skeleton(task: str, instruction: str, output_format: Mapping[str, str],
+                    constraints: Tuple[str, ...]) -> Tuple[str, str]:
+    """Serialize a prompt skeleton into the text before and after its input block"""
+    skeleton = {
+        "task": task,
+        "instruction": instruction,
+        "input": _INPUT_SLOT,
+        "output_format": dict(output_format),
+        "constraints": list(constraints)
+    }
+    prefix, suffix = _dumps_indented(skeleton).split(_dumps(_INPUT_SLOT))
+    return prefix, suffix
+
+
+def _render_prompt(fragments: Tuple[str, str], input_data: Dict[str, Any]) -> str:
+    """
+    Render a prompt from pre-serialized skeleton fragments and its input block.
+    
+    The input block sits one level deep, so its continuation lines get two
+    extra spaces. JSON strings never contain raw newlines, so the replace
+    only touches layout.
+    """
+    prefix, suffix = fragments
+    return prefix + _dumps_indented(input_data).replace("\n", "\n  ") + suffix
+
+
+_ROUTING_FRAGMENTS = _split_skeleton(
+    _ROUTING_TASK, _ROUTING_INSTRUCTION, _ROUTING_OUTPUT_FORMAT, _ROUTING_CONSTRAINTS
+)
+_TRIAGE_FRAGMENTS = _split_skeleton(
+    _TRIAGE_TASK, _TRIAGE_INSTRUCTION, _TRIAGE_OUTPUT_FORMAT, _TRIAGE_CONSTRAINTS
+)
+_FINAL_FRAGMENTS = _split_skeleton(
+    _FINAL_TASK, _FINAL_INSTRUCTION, _FINAL_OUTPUT_FORMAT, _FINAL_CONSTRAINTS
+)
+
+
+def _write_triage_prompt(errors: List[str], error_count: int) -> str:
+    """
+    Write the Fix Triage prompt directly from its known input shape.
+    
+    Only the error strings are encoded; the surrounding layout is literal
+    text matching _render_prompt output. This beats walking the input dict
+    with the pure-Python encoder, but not orjson, so fix_triage_prompt uses
+    it only when the C encoder is unavailable.
+    """
+    prefix, suffix = _TRIAGE_FRAGMENTS
+    if errors:
+        errors_json = "[\n      " + ",\n      ".join(map(_dumps, errors)) + "\n    ]"
+    else:
+        errors_json = "[]"
+    return (prefix + '{\n    "errors": ' + errors_json +
+            ',\n    "error_count": ' + str(error_count) + "\n  }" + suffix)
+
+
+# Fast paths for well-formed responses with the expected key order. String
+# captures exclude quotes, escapes and control characters, so anything that
+# needs real JSON decoding falls back to _loads(). They only beat the
+# pure-Python decoder, so the parsers skip them when orjson is available.
+_WS = r'[ \t\n\r]*'
+_JSON_STR = r'"([^"\\\x00-\x1f]*)"'
+_ROUTING_RESPONSE_RE = re.compile(
+    _WS + r'\{' + _WS + r'"next_agent"' + _WS + ':' + _WS + _JSON_STR +
+    _WS + ',' + _WS + r'"rationale"' + _WS + ':' + _WS + _JSON_STR + _WS + r'\}' + _WS
+)
+_TRIAGE_RESPONSE_RE = re.compile(
+    _WS + r'\{' + _WS + r'"action"' + _WS + ':' + _WS + _JSON_STR +
+    _WS + ',' + _WS + r'"context_focus"' + _WS + ':' + _WS + _JSON_STR + _WS + r'\}' + _WS
+)
+_FINAL_RESPONSE_RE = re.compile(
+    _WS + r'\{' + _WS + r'"commit_required"' + _WS + ':' + _WS + '(true|false)' +
+    _WS + ',' + _WS + r'"next_agent"' + _WS + ':' + _WS + _JSON_STR +
+    _WS + ',' + _WS + r'"rationale"' + _WS + ':' + _WS + _JSON_STR + _WS + r'\}' + _WS
+)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _build_routing_prompt(last_action: str, last_agent: str, last_result: str,
+                          ai_state: str, ai_queue_status: str,
+                          ai_handoff_requested: bool,
+                          available_agents: tuple) -> str:
+    """
+    Build the State Routing prompt from the status fields it consumes.
+    
+    The cache is typed, so equal-hashing inputs such as 1 and True keep
+    their own prompts.
+    
+    AI_PHASE: AGENT_COORDINATION
+    AI_STATUS: IMPLEMENTED
+    AI_COMPLEXITY: LOW
+    AI_NOTE: Cached on the prompt inputs; repeated states skip prompt assembly
+    """
+    return _render_prompt(_ROUTING_FRAGMENTS, {
+        "last_action": last_action,
+        "last_agent": last_agent,
+        "last_result": last_result,
+        "ai_state": ai_state,
+        "ai_queue_status": ai_queue_status,
+        "ai_handoff_requested": ai_handoff_requested,
+        "available_agents": list(available_agents)
+    })
+
+
+# Final Decision prompt with %s slots for the two rates; the thresholds are fixed
+_FINAL_TEMPLATE = _render_prompt(_FINAL_FRAGMENTS, {
+    "build_success_rate": _INPUT_SLOT,
+    "test_success_rate": _INPUT_SLOT,
+    "threshold_build": _COMMIT_BUILD_THRESHOLD,
+    "threshold_test": _COMMIT_TEST_THRESHOLD
+}).replace("%", "%%").replace(_dumps(_INPUT_SLOT), "%s")
+
+
+@lru_cache(maxsize=128, typed=True)
+def _build_final_decision_prompt(build_success: float, test_success: float) -> str:
+    """
+    Build the Final Decision prompt for a pair of success rates.
+    
+    The cache is typed, so 1, 1.0 and True are encoded as given rather
+    than as whichever was cached first.
+    
+    AI_PHASE: AGENT_COORDINATION
+    AI_STATUS: IMPLEMENTED
+    AI_COMPLEXITY: LOW
+    AI_NOTE: Only the two rates vary; they are encoded into a prebuilt template
+    """
+    return _FINAL_TEMPLATE % (_dumps(build_success), _dumps(test_success))
+
+
+def _commit_required(build_success: float, test_success: float) -> bool:
+    """Apply the commit thresholds to a pair of success rates"""
+    return build_success >= _COMMIT_BUILD_THRESHOLD and test_success >= _COMMIT_TEST_THRESHOLD
+
+
+# Simulated decisions come from a fixed set, so their values and responses
+# are built once. The simulators return a fresh instance built from these
+# templates, so a caller editing its decision cannot change later ones.
+_SIM_ROUTE_REASONER = RoutingDecision(
+    next_agent="ReasoningAgent",
+    rationale="Selected ReasoningAgent based on current state"
+)
+_SIM_ROUTE_FINALIZER = RoutingDecision(
+    next_agent="FinalizerAgent",
+    rationale="Selected FinalizerAgent based on current state"
+)
+_SIM_TRIAGE_MANY = TriageDecision(action="ROUTE_REASONER", context_focus="Multiple errors detected")
+_SIM_TRIAGE_ONE = TriageDecision(action="ROUTE_REASONER", context_focus="Single error needs fixing")
+_SIM_TRIAGE_NONE = TriageDecision(action="ROUTE_TESTER", context_focus="No errors, proceed to testing")
+_SIM_FINAL_COMMIT = FinalDecision(
+    commit_required=True,
+    next_agent="FinalizerAgent",
+    rationale="Build and test success rates meet thresholds"
+)
+_SIM_FINAL_FIX = FinalDecision(
+    commit_required=False,
+    next_agent="ReasoningAgent",
+    rationale="Success rates below threshold, need fixes"
+)
+
+# Serialized forms of the simulated decisions, for the *_response helpers
+_SIM_ROUTE_REASONER_RESPONSE = _dumps(asdict(_SIM_ROUTE_REASONER))
+_SIM_ROUTE_FINALIZER_RESPONSE = _dumps(asdict(_SIM_ROUTE_FINALIZER))
+_SIM_TRIAGE_MANY_RESPONSE = _dumps(asdict(_SIM_TRIAGE_MANY))
+_SIM_TRIAGE_ONE_RESPONSE = _dumps(asdict(_SIM_TRIAGE_ONE))
+_SIM_TRIAGE_NONE_RESPONSE = _dumps(asdict(_SIM_TRIAGE_NONE))
+_SIM_FINAL_COMMIT_RESPONSE = _dumps(asdict(_SIM_FINAL_COMMIT))
+_SIM_FINAL_FIX_RESPONSE = _dumps(asdict(_SIM_FINAL_FIX))
+
+
 class SMCCoordinator:
     """
     Small Model Coordinator for autonomous agent orchestration.
@@ -134,15 +410,19 @@ class SMCCoordinator:
     fast, CPU-bound models (e.g., Llama 3 8B or smaller specialized agents).
     """
     
-    def __init__(self, model_backend: Optional[Any] = None):
+    def __init__(self, model_backend: Optional[Any] = None,
+                 log_status_snapshots: bool = False):
         """
         Initialize the SMC Coordinator.
         
         Args:
             model_backend: Optional backend for AI model inference. If None,
                           uses simulated responses for testing/demo.
+            log_status_snapshots: If True, each execution log entry records
+                          the global status seen by the routing decision.
         """
         self.model_backend = model_backend
+        self.log_status_snapshots = log_status_snapshots
         self.global_status = GlobalStatus(
             last_action="INIT",
             last_agent="SYSTEM",
@@ -152,6 +432,8 @@ class SMCCoordinator:
             ai_handoff_requested=False
         )
         self.agents_registry = {}
+        # Registered agent names, refreshed by register_agent()
+        self._agent_names: tuple = ()
     
     def register_agent(self, agent_name: str, agent_instance: Any) -> None:
         """
@@ -167,6 +449,7 @@ class SMCCoordinator:
             agent_instance: Agent object implementing execute() method
         """
         self.agents_registry[agent_name] = agent_instance
+        self._agent_names = tuple(self.agents_registry)
     
     def state_routing_prompt(self, global_status: GlobalStatus) -> str:
         """
@@ -186,29 +469,20 @@ class SMCCoordinator:
         Returns:
             JSON prompt string
         """
-        prompt = {
-            "task": "state_routing",
-            "instruction": "Determine the next agent to execute based on current state. Respond ONLY with valid JSON.",
-            "input": {
-                "last_action": global_status.last_action,
-                "last_agent": global_status.last_agent,
-                "last_result": global_status.last_result,
-                "ai_state": global_status.ai_state.value,
-                "ai_queue_status": global_status.ai_queue_status.value,
-                "ai_handoff_requested": global_status.ai_handoff_requested,
-                "available_agents": list(self.agents_registry.keys())
-            },
-            "output_format": {
-                "next_agent": "string (one of available_agents or 'NONE')",
-                "rationale": "string (brief explanation)"
-            },
-            "constraints": [
-                "Response must be valid JSON",
-                "next_agent must be from available_agents or 'NONE'",
-                "rationale must be under 200 characters"
-            ]
-        }
-        return json.dumps(prompt, indent=2)
+        args = (
+            global_status.last_action,
+            global_status.last_agent,
+            global_status.last_result,
+            global_status.ai_state._value_,
+            global_status.ai_queue_status._value_,
+            global_status.ai_handoff_requested,
+            self._agent_names
+        )
+        try:
+            return _build_routing_prompt(*args)
+        except TypeError:
+            # Unhashable field values cannot key the cache; render uncached
+            return _build_routing_prompt.__wrapped__(*args)
     
     def fix_triage_prompt(self, errors: List[str]) -> str:
         """
@@ -228,24 +502,13 @@ class SMCCoordinator:
         Returns:
             JSON prompt string
         """
-        prompt = {
-            "task": "fix_triage",
-            "instruction": "Analyze errors and determine routing action. Respond ONLY with valid JSON.",
-            "input": {
-                "errors": errors[:5],  # Top 5 errors only
-                "error_count": len(errors)
-            },
-            "output_format": {
-                "action": "string (ROUTE_REASONER, ROUTE_TESTER, ROUTE_FINALIZER, or MANUAL_REVIEW)",
-                "context_focus": "string (area needing attention)"
-            },
-            "constraints": [
-                "Response must be valid JSON",
-                "action must be one of: ROUTE_REASONER, ROUTE_TESTER, ROUTE_FINALIZER, MANUAL_REVIEW",
-                "context_focus must identify specific code area or phase"
-            ]
-        }
-        return json.dumps(prompt, indent=2)
+        top_errors = errors if len(errors) <= 5 else errors[:5]  # Top 5 errors only
+        if not _C_ENCODER:
+            return _write_triage_prompt(top_errors, len(errors))
+        return _render_prompt(_TRIAGE_FRAGMENTS, {
+            "errors": top_errors,
+            "error_count": len(errors)
+        })
     
     def final_decision_prompt(self, build_success: float, test_success: float) -> str:
         """
@@ -266,28 +529,11 @@ class SMCCoordinator:
         Returns:
             JSON prompt string
         """
-        prompt = {
-            "task": "final_decision",
-            "instruction": "Determine if work is ready to commit. Respond ONLY with valid JSON.",
-            "input": {
-                "build_success_rate": build_success,
-                "test_success_rate": test_success,
-                "threshold_build": 0.95,
-                "threshold_test": 0.90
-            },
-            "output_format": {
-                "commit_required": "boolean",
-                "next_agent": "string (agent to handle next step)",
-                "rationale": "string (brief explanation)"
-            },
-            "constraints": [
-                "Response must be valid JSON",
-                "commit_required based on thresholds",
-                "If commit_required is true, next_agent should be 'Finalizer'",
-                "If commit_required is false, next_agent should suggest remediation"
-            ]
-        }
-        return json.dumps(prompt, indent=2)
+        try:
+            return _build_final_decision_prompt(build_success, test_success)
+        except TypeError:
+            # Unhashable rate values cannot key the cache; render uncached
+            return _build_final_decision_prompt.__wrapped__(build_success, test_success)
     
     def parse_routing_decision(self, response: str) -> RoutingDecision:
         """
@@ -298,7 +544,12 @@ class SMCCoordinator:
         AI_COMPLEXITY: LOW
         AI_NOTE: Parses JSON response from state routing
         """
-        data = json.loads(response)
+        if not _C_ENCODER and isinstance(response, str):
+            match = _ROUTING_RESPONSE_RE.fullmatch(response)
+            if match is not None:
+                return RoutingDecision(next_agent=match[1], rationale=match[2])
+        
+        data = _loads(response)
         return RoutingDecision(
             next_agent=data["next_agent"],
             rationale=data["rationale"]
@@ -313,7 +564,12 @@ class SMCCoordinator:
         AI_COMPLEXITY: LOW
         AI_NOTE: Parses JSON response from fix triage
         """
-        data = json.loads(response)
+        if not _C_ENCODER and isinstance(response, str):
+            match = _TRIAGE_RESPONSE_RE.fullmatch(response)
+            if match is not None:
+                return TriageDecision(action=match[1], context_focus=match[2])
+        
+        data = _loads(response)
         return TriageDecision(
             action=data["action"],
             context_focus=data["context_focus"]
@@ -328,7 +584,16 @@ class SMCCoordinator:
         AI_COMPLEXITY: LOW
         AI_NOTE: Parses JSON response from final decision
         """
-        data = json.loads(response)
+        if not _C_ENCODER and isinstance(response, str):
+            match = _FINAL_RESPONSE_RE.fullmatch(response)
+            if match is not None:
+                return FinalDecision(
+                    commit_required=match[1] == "true",
+                    next_agent=match[2],
+                    rationale=match[3]
+                )
+        
+        data = _loads(response)
         return FinalDecision(
             commit_required=data["commit_required"],
             next_agent=data["next_agent"],
@@ -347,14 +612,12 @@ class SMCCoordinator:
         Returns:
             RoutingDecision with next agent and rationale
         """
-        prompt = self.state_routing_prompt(self.global_status)
-        
-        if self.model_backend:
-            response = self.model_backend.generate(prompt)
-        else:
-            # Simulated response for testing
-            response = self._simulate_routing_response()
+        if self.model_backend is None:
+            # Simulated decision for testing; no prompt/response round-trip
+            return self._simulate_routing_decision()
         
+        prompt = self.state_routing_prompt(self.global_status)
+        response = self.model_backend.generate(prompt)
         return self.parse_routing_decision(response)
     
     def execute_triage(self, errors: List[str]) -> TriageDecision:
@@ -372,14 +635,12 @@ class SMCCoordinator:
         Returns:
             TriageDecision with action and context focus
         """
-        prompt = self.fix_triage_prompt(errors)
-        
-        if self.model_backend:
-            response = self.model_backend.generate(prompt)
-        else:
-            # Simulated response for testing
-            response = self._simulate_triage_response(errors)
+        if self.model_backend is None:
+            # Simulated decision for testing; no prompt/response round-trip
+            return self._simulate_triage_decision(errors)
         
+        prompt = self.fix_triage_prompt(errors)
+        response = self.model_backend.generate(prompt)
         return self.parse_triage_decision(response)
     
     def execute_final_decision(self) -> FinalDecision:
@@ -394,17 +655,15 @@ class SMCCoordinator:
         Returns:
             FinalDecision with commit requirement and next agent
         """
+        if self.model_backend is None:
+            # Simulated decision for testing; no prompt/response round-trip
+            return self._simulate_final_decision()
+        
         prompt = self.final_decision_prompt(
             self.global_status.build_success_rate,
             self.global_status.test_success_rate
         )
-        
-        if self.model_backend:
-            response = self.model_backend.generate(prompt)
-        else:
-            # Simulated response for testing
-            response = self._simulate_final_decision_response()
-        
+        response = self.model_backend.generate(prompt)
         return self.parse_final_decision(response)
     
     def run_coordination_loop(self, max_iterations: int = 10) -> Dict[str, Any]:
@@ -424,64 +683,57 @@ class SMCCoordinator:
         """
         iteration = 0
         execution_log = []
+        log_append = execution_log.append
+        status = self.global_status
+        registry = self.agents_registry
+        log_status_snapshots = self.log_status_snapshots
         
-        while iteration < max_iterations:
-            iteration += 1
-            
+        for iteration in range(1, max_iterations + 1):
             # Check termination conditions
-            if self.global_status.ai_state == AgentState.DONE:
-                execution_log.append({
-                    "iteration": iteration,
-                    "action": "TERMINATE",
-                    "reason": "AI_STATE is DONE"
-                })
-                break
-            
-            if self.global_status.ai_state == AgentState.FAILED:
-                execution_log.append({
+            reason = _TERMINAL_REASONS.get(status.ai_state)
+            if reason is not None:
+                log_append({
                     "iteration": iteration,
                     "action": "TERMINATE",
-                    "reason": "AI_STATE is FAILED"
+                    "reason": reason
                 })
                 break
             
             # Execute routing decision
             routing = self.execute_routing()
+            next_agent = routing.next_agent
             
-            execution_log.append({
+            # One log entry per iteration, completed once the agent has run
+            entry = {
                 "iteration": iteration,
                 "routing_decision": {
-                    "next_agent": routing.next_agent,
+                    "next_agent": next_agent,
                     "rationale": routing.rationale
-                },
-                "global_status": self.global_status.to_dict()
-            })
+                }
+            }
+            if log_status_snapshots:
+                entry["global_status"] = status.to_dict()
+            log_append(entry)
             
             # Handle routing decision
-            if routing.next_agent == "NONE" or routing.next_agent not in self.agents_registry:
-                execution_log.append({
-                    "iteration": iteration,
-                    "action": "TERMINATE",
-                    "reason": f"No valid next agent: {routing.next_agent}"
-                })
+            agent = registry.get(next_agent)
+            if agent is None or next_agent == "NONE":
+                entry["action"] = "TERMINATE"
+                entry["reason"] = f"No valid next agent: {next_agent}"
                 break
             
             # Execute agent
-            agent = self.agents_registry[routing.next_agent]
-            agent_result = agent.execute(self.global_status)
+            agent_result = agent.execute(status)
             
             # Update global status based on agent result
-            self._update_status_from_result(agent_result, routing.next_agent)
+            self._update_status_from_result(agent_result, next_agent)
             
-            execution_log.append({
-                "iteration": iteration,
-                "agent_executed": routing.next_agent,
-                "agent_result": agent_result
-            })
+            entry["agent_executed"] = next_agent
+            entry["agent_result"] = agent_result
         
         return {
             "total_iterations": iteration,
-            "final_state": self.global_status.to_dict(),
+            "final_state": status.to_dict(),
             "execution_log": execution_log
         }
     
@@ -494,84 +746,99 @@ class SMCCoordinator:
         AI_COMPLEXITY: MEDIUM
         AI_NOTE: Updates global state from structured agent output
         """
-        self.global_status.last_action = result.get("action", "UNKNOWN")
-        self.global_status.last_agent = agent_name
-        self.global_status.last_result = result.get("result", "UNKNOWN")
+        status = self.global_status
+        get = result.get
+        status.last_action = get("action", "UNKNOWN")
+        status.last_agent = agent_name
+        status.last_result = get("result", "UNKNOWN")
         
         # Update AI_STATE if provided
-        if "ai_state" in result:
-            self.global_status.ai_state = AgentState(result["ai_state"])
+        ai_state = get("ai_state", _MISSING)
+        if ai_state is not _MISSING:
+            try:
+                status.ai_state = _AGENT_STATE_BY_VALUE[ai_state]
+            except (KeyError, TypeError):
+                # Members pass through; invalid values raise ValueError
+                status.ai_state = AgentState(ai_state)
         
         # Update AI_QUEUE_STATUS if provided
-        if "ai_queue_status" in result:
-            self.global_status.ai_queue_status = QueueStatus(result["ai_queue_status"])
+        ai_queue_status = get("ai_queue_status", _MISSING)
+        if ai_queue_status is not _MISSING:
+            try:
+                status.ai_queue_status = _QUEUE_STATUS_BY_VALUE[ai_queue_status]
+            except (KeyError, TypeError):
+                status.ai_queue_status = QueueStatus(ai_queue_status)
         
         # Update AI_HANDOFF_REQUESTED if provided
-        if "ai_handoff_requested" in result:
-            self.global_status.ai_handoff_requested = result["ai_handoff_requested"]
+        handoff = get("ai_handoff_requested", _MISSING)
+        if handoff is not _MISSING:
+            status.ai_handoff_requested = handoff
         
         # Update metrics if provided
-        if "build_success_rate" in result:
-            self.global_status.build_success_rate = result["build_success_rate"]
-        
-        if "test_success_rate" in result:
-            self.global_status.test_success_rate = result["test_success_rate"]
-        
-        if "errors" in result:
-            self.global_status.top_errors = result["errors"][:5]
-            self.global_status.error_count = len(result["errors"])
+        build_rate = get("build_success_rate", _MISSING)
+        if build_rate is not _MISSING:
+            status.build_success_rate = build_rate
+        
+        test_rate = get("test_success_rate", _MISSING)
+        if test_rate is not _MISSING:
+            status.test_success_rate = test_rate
+        
+        errors = get("errors", _MISSING)
+        if errors is not _MISSING:
+            status.top_errors = errors[:5]  # Always a copy; agents may edit either list
+            status.error_count = len(errors)
     
     # Simulation methods for testing without actual AI backend
     
-    def _simulate_routing_response(self) -> str:
-        """Simulate routing response for testing"""
-        if self.global_status.ai_handoff_requested:
-            next_agent = "ReasoningAgent"
-        elif self.global_status.ai_state == AgentState.READY:
-            next_agent = "ReasoningAgent"
-        elif self.global_status.error_count > 0:
-            next_agent = "ReasoningAgent"
+    def _simulate_routing_decision(self) -> RoutingDecision:
+        """Simulate routing decision for testing"""
+        status = self.global_status
+        if (status.ai_handoff_requested or status.ai_state is AgentState.READY
+                or status.error_count > 0):
+            template = _SIM_ROUTE_REASONER
         else:
-            next_agent = "FinalizerAgent"
-        
-        return json.dumps({
-            "next_agent": next_agent,
-            "rationale": f"Selected {next_agent} based on current state"
-        })
+            template = _SIM_ROUTE_FINALIZER
+        return RoutingDecision(next_agent=template.next_agent, rationale=template.rationale)
     
-    def _simulate_triage_response(self, errors: List[str]) -> str:
-        """Simulate triage response for testing"""
+    def _simulate_triage_decision(self, errors: List[str]) -> TriageDecision:
+        """Simulate triage decision for testing"""
         if len(errors) > 3:
-            action = "ROUTE_REASONER"
-            context = "Multiple errors detected"
-        elif len(errors) > 0:
-            action = "ROUTE_REASONER"
-            context = "Single error needs fixing"
+            template = _SIM_TRIAGE_MANY
+        elif errors:
+            template = _SIM_TRIAGE_ONE
         else:
-            action = "ROUTE_TESTER"
-            context = "No errors, proceed to testing"
-        
-        return json.dumps({
-            "action": action,
-            "context_focus": context
-        })
+            template = _SIM_TRIAGE_NONE
+        return TriageDecision(action=template.action, context_focus=template.context_focus)
     
-    def _simulate_final_decision_response(self) -> str:
-        """Simulate final decision response for testing"""
-        commit = (
-            self.global_status.build_success_rate >= 0.95 and
-            self.global_status.test_success_rate >= 0.90
-        )
-        
-        if commit:
-            next_agent = "FinalizerAgent"
-            rationale = "Build and test success rates meet thresholds"
+    def _simulate_final_decision(self) -> FinalDecision:
+        """Simulate final decision for testing"""
+        status = self.global_status
+        if _commit_required(status.build_success_rate, status.test_success_rate):
+            template = _SIM_FINAL_COMMIT
         else:
-            next_agent = "ReasoningAgent"
-            rationale = "Success rates below threshold, need fixes"
-        
-        return json.dumps({
-            "commit_required": commit,
-            "next_agent": next_agent,
-            "rationale": rationale
-        })
+            template = _SIM_FINAL_FIX
+        return FinalDecision(
+            commit_required=template.commit_required,
+            next_agent=template.next_agent,
+            rationale=template.rationale
+        )
+    
+    def _simulate_routing_response(self) -> str:
+        """Simulate routing response JSON for testing"""
+        if self._simulate_routing_decision().next_agent == _SIM_ROUTE_REASONER.next_agent:
+            return _SIM_ROUTE_REASONER_RESPONSE
+        return _SIM_ROUTE_FINALIZER_RESPONSE
+    
+    def _simulate_triage_response(self, errors: List[str]) -> str:
+        """Simulate triage response JSON for testing"""
+        if len(errors) > 3:
+            return _SIM_TRIAGE_MANY_RESPONSE
+        if errors:
+            return _SIM_TRIAGE_ONE_RESPONSE
+        return _SIM_TRIAGE_NONE_RESPONSE
+    
+    def _simulate_final_decision_response(self) -> str:
+        """Simulate final decision response JSON for testing"""
+        if self._simulate_final_decision().commit_required:
+            return _SIM_FINAL_COMMIT_RESPONSE
+        return _SIM_FINAL_FIX_RESPONSE
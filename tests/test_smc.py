@@ -14,18 +14,67 @@ This file is part of the ACD Specification.
 """
 
 import unittest
-import json
+from unittest import mock
+import os
 import sys
-from pathlib import Path
+from dataclasses import fields, replace
+from types import MappingProxyType
 
 # Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
 
 from smc_coordinator import (
     SMCCoordinator, GlobalStatus, AgentState, QueueStatus,
     RoutingDecision, TriageDecision, FinalDecision
 )
-from example_agents import ReasoningAgent, TesterAgent, FinalizerAgent, BuilderAgent
+from example_agents import get_agent
+
+# Decode and encode test payloads with orjson when available
+try:
+    import orjson
+
+    def _dumps(obj):
+        """Serialize obj as compact JSON text"""
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _dumps = json.dumps
+    _loads = json.loads
+
+# (case name, parser, response payload, expected decision class)
+_PARSE_CASES = (
+    ("routing", SMCCoordinator.parse_routing_decision, {
+        "next_agent": "ReasoningAgent",
+        "rationale": "Need to analyze errors"
+    }, RoutingDecision),
+    # Escapes and reordered keys fall outside the parser fast path
+    ("routing_escaped", SMCCoordinator.parse_routing_decision, {
+        "rationale": "Quoted \"reason\"\nsecond line",
+        "next_agent": "TesterAgent"
+    }, RoutingDecision),
+    ("triage", SMCCoordinator.parse_triage_decision, {
+        "action": "ROUTE_REASONER",
+        "context_focus": "MEMORY_TRANSLATION"
+    }, TriageDecision),
+    ("final", SMCCoordinator.parse_final_decision, {
+        "commit_required": True,
+        "next_agent": "FinalizerAgent",
+        "rationale": "All tests passing"
+    }, FinalDecision),
+)
+
+# Agent result fed to _update_status_from_result
+_BUILD_SUCCESS_RESULT = MappingProxyType({
+    "action": "BUILD",
+    "result": "SUCCESS",
+    "ai_state": "READY",
+    "ai_queue_status": "COMPLETED",
+    "ai_handoff_requested": False,
+    "build_success_rate": 1.0
+})
 
 
 class TestGlobalStatus(unittest.TestCase):
@@ -49,10 +98,10 @@ class TestGlobalStatus(unittest.TestCase):
             ai_handoff_requested=False
         )
         
-        self.assertEqual(status.last_action, "BUILD")
-        self.assertEqual(status.last_agent, "BuilderAgent")
-        self.assertEqual(status.ai_state, AgentState.READY)
-        self.assertEqual(status.ai_handoff_requested, False)
+        self.assertEqual(
+            (status.last_action, status.last_agent, status.ai_state, status.ai_handoff_requested),
+            ("BUILD", "BuilderAgent", AgentState.READY, False)
+        )
     
     def test_global_status_to_dict(self):
         """Test converting GlobalStatus to dictionary"""
@@ -67,11 +116,63 @@ class TestGlobalStatus(unittest.TestCase):
         
         status_dict = status.to_dict()
         
-        self.assertIsInstance(status_dict, dict)
-        self.assertEqual(status_dict["last_action"], "TEST")
-        self.assertEqual(status_dict["ai_state"], "BLOCKED")
-        self.assertEqual(status_dict["ai_queue_status"], "REJECTED")
-        self.assertTrue(status_dict["ai_handoff_requested"])
+        self.assertEqual(
+            (status_dict["last_action"], status_dict["ai_state"],
+             status_dict["ai_queue_status"], status_dict["ai_handoff_requested"]),
+            ("TEST", "BLOCKED", "REJECTED", True)
+        )
+
+    def test_global_status_to_dict_after_update(self):
+        """Test to_dict reflects fields assigned after a previous call"""
+        status = GlobalStatus(
+            last_action="TEST",
+            last_agent="TesterAgent",
+            last_result="FAILURE",
+            ai_state=AgentState.BLOCKED,
+            ai_queue_status=QueueStatus.REJECTED,
+            ai_handoff_requested=True
+        )
+
+        first = status.to_dict()
+        first["last_action"] = "MUTATED"
+        status.ai_state = AgentState.READY
+        status.error_count = 2
+
+        status_dict = status.to_dict()
+
+        self.assertEqual(
+            (status_dict["last_action"], status_dict["ai_state"], status_dict["error_count"]),
+            ("TEST", "READY", 2)
+        )
+
+    def test_global_status_none_top_errors(self):
+        """Test an explicit top_errors=None is normalized to an empty list"""
+        status = GlobalStatus(
+            last_action="INIT",
+            last_agent="SYSTEM",
+            last_result="SUCCESS",
+            ai_state=AgentState.READY,
+            ai_queue_status=QueueStatus.QUEUED,
+            ai_handoff_requested=False,
+            top_errors=None
+        )
+
+        self.assertEqual(status.top_errors, [])
+        _loads(SMCCoordinator().fix_triage_prompt(status.top_errors))
+
+    def test_global_status_fields_match_to_dict(self):
+        """Test the dataclass declares exactly the serialized fields"""
+        field_names = [f.name for f in fields(GlobalStatus)]
+        status = GlobalStatus(
+            last_action="INIT",
+            last_agent="SYSTEM",
+            last_result="SUCCESS",
+            ai_state=AgentState.READY,
+            ai_queue_status=QueueStatus.QUEUED,
+            ai_handoff_requested=False
+        )
+
+        self.assertEqual(field_names, list(status.to_dict()))
 
 
 class TestSMCCoordinator(unittest.TestCase):
@@ -96,7 +197,7 @@ class TestSMCCoordinator(unittest.TestCase):
     
     def test_register_agent(self):
         """Test registering agents"""
-        agent = ReasoningAgent()
+        agent = get_agent("ReasoningAgent")
         self.coordinator.register_agent("ReasoningAgent", agent)
         
         self.assertIn("ReasoningAgent", self.coordinator.agents_registry)
@@ -104,36 +205,98 @@ class TestSMCCoordinator(unittest.TestCase):
     
     def test_state_routing_prompt(self):
         """Test state routing prompt generation"""
-        self.coordinator.register_agent("ReasoningAgent", ReasoningAgent())
+        self.coordinator.register_agent("ReasoningAgent", get_agent("ReasoningAgent"))
         
         prompt = self.coordinator.state_routing_prompt(self.coordinator.global_status)
         
-        self.assertIsInstance(prompt, str)
-        prompt_data = json.loads(prompt)
+        prompt_data = _loads(prompt)
         
         self.assertEqual(prompt_data["task"], "state_routing")
         self.assertIn("input", prompt_data)
         self.assertIn("output_format", prompt_data)
         self.assertIn("available_agents", prompt_data["input"])
     
+    def test_state_routing_prompt_tracks_changes(self):
+        """Test cached routing prompts follow status and registry changes"""
+        status = self.coordinator.global_status
+        first = self.coordinator.state_routing_prompt(status)
+        self.assertEqual(self.coordinator.state_routing_prompt(status), first)
+
+        self.coordinator.register_agent("ReasoningAgent", get_agent("ReasoningAgent"))
+        prompt_data = _loads(self.coordinator.state_routing_prompt(status))
+        self.assertEqual(prompt_data["input"]["available_agents"], ["ReasoningAgent"])
+
+        status.ai_state = AgentState.BLOCKED
+        status.ai_handoff_requested = True
+        prompt_data = _loads(self.coordinator.state_routing_prompt(status))
+        self.assertEqual(prompt_data["input"]["ai_state"], "BLOCKED")
+        self.assertTrue(prompt_data["input"]["ai_handoff_requested"])
+
+    def test_state_routing_prompt_typed_inputs(self):
+        """Test routing prompts do not depend on previously cached equal values"""
+        status = self.coordinator.global_status
+        status.ai_handoff_requested = 1
+        self.assertIn('"ai_handoff_requested": 1', self.coordinator.state_routing_prompt(status))
+        status.ai_handoff_requested = True
+        self.assertIn('"ai_handoff_requested": true', self.coordinator.state_routing_prompt(status))
+
+        status.last_action = ["BUILD", "TEST"]
+        prompt_data = _loads(self.coordinator.state_routing_prompt(status))
+        self.assertEqual(prompt_data["input"]["last_action"], ["BUILD", "TEST"])
+
     def test_fix_triage_prompt(self):
         """Test fix triage prompt generation"""
         errors = ["Error 1", "Error 2", "Error 3"]
         prompt = self.coordinator.fix_triage_prompt(errors)
         
-        self.assertIsInstance(prompt, str)
-        prompt_data = json.loads(prompt)
+        prompt_data = _loads(prompt)
         
         self.assertEqual(prompt_data["task"], "fix_triage")
         self.assertIn("errors", prompt_data["input"])
         self.assertEqual(len(prompt_data["input"]["errors"]), 3)
-    
+
+    def test_prompt_layout(self):
+        """Test spliced prompts keep the 2-space indented JSON layout"""
+        import json  # The stdlib indent=2 output is the reference layout
+
+        self.coordinator.register_agent("ReasoningAgent", get_agent("ReasoningAgent"))
+        prompts = [
+            self.coordinator.state_routing_prompt(self.coordinator.global_status),
+            self.coordinator.fix_triage_prompt(["Error 1", "Error\n2"]),
+            self.coordinator.fix_triage_prompt(["café ☃"]),
+            self.coordinator.fix_triage_prompt([]),
+            self.coordinator.final_decision_prompt(0.95, 0.90)
+        ]
+
+        for prompt in prompts:
+            self.assertEqual(prompt, json.dumps(json.loads(prompt), indent=2, ensure_ascii=False))
+
+    def test_direct_triage_prompt_matches_render(self):
+        """Test the hand-written triage prompt matches the generic renderer"""
+        from smc_coordinator import _write_triage_prompt, _render_prompt, _TRIAGE_FRAGMENTS
+
+        for errors in ([], ["Error 1"], ['Quote " and \\ slash', "Tab\there", "café"]):
+            expected = _render_prompt(_TRIAGE_FRAGMENTS, {"errors": errors, "error_count": 7})
+            self.assertEqual(_write_triage_prompt(errors, 7), expected)
+
+    def test_final_decision_prompt_template(self):
+        """Test the templated final decision prompt matches the generic renderer"""
+        from smc_coordinator import _render_prompt, _FINAL_FRAGMENTS
+
+        for build, test in ((0.95, 0.9), (0.1 + 0.2, 1), (0.0, 1e-07)):
+            expected = _render_prompt(_FINAL_FRAGMENTS, {
+                "build_success_rate": build,
+                "test_success_rate": test,
+                "threshold_build": 0.95,
+                "threshold_test": 0.90
+            })
+            self.assertEqual(self.coordinator.final_decision_prompt(build, test), expected)
+
     def test_final_decision_prompt(self):
         """Test final decision prompt generation"""
         prompt = self.coordinator.final_decision_prompt(0.95, 0.90)
         
-        self.assertIsInstance(prompt, str)
-        prompt_data = json.loads(prompt)
+        prompt_data = _loads(prompt)
         
         self.assertEqual(prompt_data["task"], "final_decision")
         self.assertIn("build_success_rate", prompt_data["input"])
@@ -141,56 +304,45 @@ class TestSMCCoordinator(unittest.TestCase):
         self.assertEqual(prompt_data["input"]["build_success_rate"], 0.95)
         self.assertEqual(prompt_data["input"]["test_success_rate"], 0.90)
     
-    def test_parse_routing_decision(self):
-        """Test parsing routing decision from JSON"""
-        response = json.dumps({
-            "next_agent": "ReasoningAgent",
-            "rationale": "Need to analyze errors"
-        })
-        
-        decision = self.coordinator.parse_routing_decision(response)
-        
-        self.assertIsInstance(decision, RoutingDecision)
-        self.assertEqual(decision.next_agent, "ReasoningAgent")
-        self.assertEqual(decision.rationale, "Need to analyze errors")
-    
-    def test_parse_triage_decision(self):
-        """Test parsing triage decision from JSON"""
-        response = json.dumps({
-            "action": "ROUTE_REASONER",
-            "context_focus": "MEMORY_TRANSLATION"
-        })
-        
-        decision = self.coordinator.parse_triage_decision(response)
-        
-        self.assertIsInstance(decision, TriageDecision)
-        self.assertEqual(decision.action, "ROUTE_REASONER")
-        self.assertEqual(decision.context_focus, "MEMORY_TRANSLATION")
-    
-    def test_parse_final_decision(self):
-        """Test parsing final decision from JSON"""
-        response = json.dumps({
-            "commit_required": True,
-            "next_agent": "FinalizerAgent",
-            "rationale": "All tests passing"
-        })
-        
-        decision = self.coordinator.parse_final_decision(response)
-        
-        self.assertIsInstance(decision, FinalDecision)
-        self.assertTrue(decision.commit_required)
-        self.assertEqual(decision.next_agent, "FinalizerAgent")
+    def test_parse_decisions(self):
+        """Test parsing each decision type from JSON"""
+        for name, parser, payload, decision_class in _PARSE_CASES:
+            with self.subTest(case=name):
+                decision = parser(self.coordinator, _dumps(payload))
+                
+                self.assertIsInstance(decision, decision_class)
+                for key, value in payload.items():
+                    self.assertEqual(getattr(decision, key), value)
     
     def test_execute_routing(self):
         """Test executing routing decision"""
-        self.coordinator.register_agent("ReasoningAgent", ReasoningAgent())
+        self.coordinator.register_agent("ReasoningAgent", get_agent("ReasoningAgent"))
         
         decision = self.coordinator.execute_routing()
         
         self.assertIsInstance(decision, RoutingDecision)
         self.assertIsInstance(decision.next_agent, str)
         self.assertIsInstance(decision.rationale, str)
-    
+
+    def test_execute_routing_with_backend(self):
+        """Test routing sends the prompt to the model backend and parses its reply"""
+        class StubBackend:
+            def __init__(self):
+                self.prompts = []
+
+            def generate(self, prompt):
+                self.prompts.append(prompt)
+                return _dumps({"next_agent": "TesterAgent", "rationale": "Run tests"})
+
+        backend = StubBackend()
+        coordinator = SMCCoordinator(model_backend=backend)
+
+        decision = coordinator.execute_routing()
+
+        self.assertEqual(decision.next_agent, "TesterAgent")
+        self.assertEqual(len(backend.prompts), 1)
+        self.assertEqual(_loads(backend.prompts[0])["task"], "state_routing")
+
     def test_execute_triage(self):
         """Test executing triage decision"""
         errors = ["ImportError: No module named 'test'"]
@@ -209,43 +361,156 @@ class TestSMCCoordinator(unittest.TestCase):
         
         self.assertIsInstance(decision, FinalDecision)
         self.assertIsInstance(decision.commit_required, bool)
+
+    def test_final_decision_prompt_typed_inputs(self):
+        """Test final decision prompts encode rates as given, not as cached"""
+        for build, test, expected in ((1, 0, "1"), (True, False, "true"),
+                                      (1.0, 1.0, "1.0"), (1, 1, "1")):
+            prompt_data = _loads(self.coordinator.final_decision_prompt(build, test))
+            self.assertEqual(_dumps(prompt_data["input"]["build_success_rate"]), expected)
+
+    def test_final_decision_prompt_unhashable_inputs(self):
+        """Test final decision prompts render rates that cannot key the cache"""
+        prompt_data = _loads(self.coordinator.final_decision_prompt([0.9], {"rate": 0.8}))
+        self.assertEqual(
+            (prompt_data["input"]["build_success_rate"], prompt_data["input"]["test_success_rate"]),
+            ([0.9], {"rate": 0.8})
+        )
+
+    def test_simulated_decisions_are_independent(self):
+        """Test editing a returned simulated decision does not affect later ones"""
+        routing = self.coordinator.execute_routing()
+        triage = self.coordinator.execute_triage([])
+        final = self.coordinator.execute_final_decision()
+        routing.rationale = triage.context_focus = final.rationale = "edited"
+
+        self.assertNotEqual(self.coordinator.execute_routing().rationale, "edited")
+        self.assertNotEqual(SMCCoordinator().execute_triage([]).context_focus, "edited")
+        self.assertNotEqual(self.coordinator.execute_final_decision().rationale, "edited")
+
+    def test_commit_required_thresholds(self):
+        """Test the commit rule is inclusive at both thresholds"""
+        from smc_coordinator import _commit_required
+
+        self.assertTrue(_commit_required(0.95, 0.90))
+        self.assertFalse(_commit_required(0.94, 1.0))
+        self.assertFalse(_commit_required(1.0, 0.89))
+
+    def test_simulated_responses_match_decisions(self):
+        """Test simulated response JSON parses back to the simulated decision"""
+        coordinator = self.coordinator
+        self.assertEqual(coordinator.parse_routing_decision(coordinator._simulate_routing_response()),
+                         coordinator._simulate_routing_decision())
+        for errors in ([], ["Error 1"], ["Error"] * 4):
+            self.assertEqual(coordinator.parse_triage_decision(coordinator._simulate_triage_response(errors)),
+                             coordinator._simulate_triage_decision(errors))
+        for rate in (0.5, 1.0):
+            coordinator.global_status.build_success_rate = rate
+            coordinator.global_status.test_success_rate = rate
+            self.assertEqual(coordinator.parse_final_decision(coordinator._simulate_final_decision_response()),
+                             coordinator._simulate_final_decision())
     
     def test_update_status_from_result(self):
         """Test updating global status from agent result"""
-        result = {
-            "action": "BUILD",
-            "result": "SUCCESS",
-            "ai_state": "READY",
-            "ai_queue_status": "COMPLETED",
-            "ai_handoff_requested": False,
-            "build_success_rate": 1.0
-        }
-        
-        self.coordinator._update_status_from_result(result, "BuilderAgent")
-        
-        self.assertEqual(self.coordinator.global_status.last_action, "BUILD")
-        self.assertEqual(self.coordinator.global_status.last_agent, "BuilderAgent")
-        self.assertEqual(self.coordinator.global_status.ai_state, AgentState.READY)
-        self.assertEqual(self.coordinator.global_status.build_success_rate, 1.0)
+        # Read-only input also checks that the result is not modified
+        self.coordinator._update_status_from_result(_BUILD_SUCCESS_RESULT, "BuilderAgent")
+        
+        status = self.coordinator.global_status
+        self.assertEqual(
+            (status.last_action, status.last_agent, status.ai_state, status.build_success_rate),
+            ("BUILD", "BuilderAgent", AgentState.READY, 1.0)
+        )
     
+    def test_update_status_from_result_enum_inputs(self):
+        """Test results may carry enum members, and invalid states raise ValueError"""
+        self.coordinator._update_status_from_result(
+            {"ai_state": AgentState.DONE, "ai_queue_status": QueueStatus.APPROVED}, "CustomAgent"
+        )
+        status = self.coordinator.global_status
+        self.assertEqual((status.ai_state, status.ai_queue_status),
+                         (AgentState.DONE, QueueStatus.APPROVED))
+
+        for result in ({"ai_state": "SLEEPING"}, {"ai_queue_status": "LOST"}):
+            with self.subTest(result=result):
+                with self.assertRaises(ValueError):
+                    self.coordinator._update_status_from_result(result, "CustomAgent")
+
     def test_coordination_loop_basic(self):
         """Test basic coordination loop"""
         # Register agents
-        self.coordinator.register_agent("ReasoningAgent", ReasoningAgent())
-        self.coordinator.register_agent("FinalizerAgent", FinalizerAgent())
+        self.coordinator.register_agent("ReasoningAgent", get_agent("ReasoningAgent"))
+        self.coordinator.register_agent("FinalizerAgent", get_agent("FinalizerAgent"))
         
         # Set up state that will complete quickly
         self.coordinator.global_status.build_success_rate = 0.98
         self.coordinator.global_status.test_success_rate = 0.95
         
-        # Run loop
-        result = self.coordinator.run_coordination_loop(max_iterations=3)
+        # Route straight to the finalizer; this test checks the result shape
+        stub_routing = RoutingDecision(next_agent="FinalizerAgent", rationale="stub")
+        with mock.patch.object(self.coordinator, "execute_routing", return_value=stub_routing):
+            result = self.coordinator.run_coordination_loop(max_iterations=3)
         
+        self.assertEqual(result["execution_log"][0]["agent_executed"], "FinalizerAgent")
         self.assertIn("total_iterations", result)
         self.assertIn("final_state", result)
         self.assertIn("execution_log", result)
         self.assertLessEqual(result["total_iterations"], 3)
 
+    def test_coordination_loop_status_snapshots(self):
+        """Test execution log entries carry status snapshots only on request"""
+        for snapshots in (False, True):
+            coordinator = SMCCoordinator(log_status_snapshots=snapshots)
+            coordinator.register_agent("ReasoningAgent", get_agent("ReasoningAgent"))
+
+            result = coordinator.run_coordination_loop(max_iterations=3)
+
+            entry = result["execution_log"][0]
+            self.assertEqual(entry["agent_executed"], "ReasoningAgent")
+            self.assertIn("routing_decision", entry)
+            self.assertEqual("global_status" in entry, snapshots)
+
+    def test_status_snapshots_survive_in_place_edits(self):
+        """Test logged snapshots keep their errors when an agent edits the live list"""
+        class PoppingAgent:
+            def execute(self, global_status):
+                global_status.top_errors.pop(0)
+                return {"action": "FIX", "result": "SUCCESS"}
+
+        coordinator = SMCCoordinator(log_status_snapshots=True)
+        coordinator.register_agent("ReasoningAgent", PoppingAgent())
+        coordinator.global_status.top_errors = ["e1", "e2", "e3"]
+
+        result = coordinator.run_coordination_loop(max_iterations=3)
+
+        self.assertEqual(
+            [entry["global_status"]["top_errors"] for entry in result["execution_log"]],
+            [["e1", "e2", "e3"], ["e2", "e3"], ["e3"]]
+        )
+
+    def test_status_top_errors_copied_from_result(self):
+        """Test top_errors never aliases the errors list of an agent result"""
+        class ReportThenPopAgent:
+            def __init__(self):
+                self.calls = 0
+
+            def execute(self, global_status):
+                self.calls += 1
+                if self.calls == 1:
+                    return {"action": "TEST", "result": "FAILURE", "errors": ["e1", "e2"]}
+                global_status.top_errors.pop(0)
+                return {"action": "FIX", "result": "SUCCESS"}
+
+        coordinator = SMCCoordinator()
+        coordinator.register_agent("ReasoningAgent", ReportThenPopAgent())
+        result = coordinator.run_coordination_loop(max_iterations=2)
+        self.assertEqual(result["execution_log"][0]["agent_result"]["errors"], ["e1", "e2"])
+
+        errors = ["e1"]
+        coordinator._update_status_from_result({"errors": errors}, "TesterAgent")
+        errors.extend(["e2"] * 6)
+        status = coordinator.global_status
+        self.assertEqual((status.top_errors, status.error_count), (["e1"], 1))
+
 
 class TestReasoningAgent(unittest.TestCase):
     """
@@ -257,10 +522,11 @@ class TestReasoningAgent(unittest.TestCase):
     AI_NOTE: Tests for ReasoningAgent class
     """
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.agent = ReasoningAgent()
-        self.global_status = GlobalStatus(
+    @classmethod
+    def setUpClass(cls):
+        """Fetch the shared agent and build the status template once per class"""
+        cls.agent = get_agent("ReasoningAgent")
+        cls._template_status = GlobalStatus(
             last_action="BUILD",
             last_agent="BuilderAgent",
             last_result="FAILURE",
@@ -269,6 +535,10 @@ class TestReasoningAgent(unittest.TestCase):
             ai_handoff_requested=True
         )
     
+    def setUp(self):
+        """Set up test fixtures"""
+        self.global_status = replace(self._template_status, top_errors=[])
+    
     def test_agent_initialization(self):
         """Test agent initializes correctly"""
         self.assertEqual(self.agent.name, "ReasoningAgent")
@@ -295,7 +565,30 @@ class TestReasoningAgent(unittest.TestCase):
         self.assertEqual(result["action"], "ANALYZE")
         self.assertEqual(result["result"], "SUCCESS")
         self.assertEqual(result["ai_state"], "DONE")
-    
+
+    def test_generate_fix_priority(self):
+        """Test error kinds are matched in priority order, case-insensitively"""
+        cases = (
+            ("Syntax Error while parsing the import block", "SYNTAX"),
+            ("ImportError: name 'x' is not defined", "IMPORT"),
+            ("Variable 'x' is UNDEFINED", "UNDEFINED"),
+            ("NameError: name 'x' is not defined", "UNDEFINED")
+        )
+        for error, error_type in cases:
+            with self.subTest(error=error):
+                self.assertEqual(self.agent._generate_fix(error)["error_type"], error_type)
+
+    def test_generate_fix_manual_fallback(self):
+        """Test unmatched errors fall back to manual review with the message"""
+        error = "RuntimeError: worker exited"
+
+        fix = self.agent._generate_fix(error)
+
+        self.assertEqual(
+            (fix["fix_type"], fix["error_type"], fix["error_message"]),
+            ("MANUAL_REVIEW", "UNKNOWN", error)
+        )
+
     def test_structured_output_format(self):
         """Test that output is properly structured JSON"""
         self.global_status.top_errors = ["SyntaxError: invalid syntax"]
@@ -303,8 +596,7 @@ class TestReasoningAgent(unittest.TestCase):
         result = self.agent.execute(self.global_status)
         
         # Verify can be serialized to JSON
-        json_str = json.dumps(result)
-        self.assertIsInstance(json_str, str)
+        _dumps(result)
         
         # Verify has required fields
         self.assertIn("action", result)
@@ -323,10 +615,11 @@ class TestTesterAgent(unittest.TestCase):
     AI_NOTE: Tests for TesterAgent class
     """
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.agent = TesterAgent()
-        self.global_status = GlobalStatus(
+    @classmethod
+    def setUpClass(cls):
+        """Fetch the shared agent and build the status template once per class"""
+        cls.agent = get_agent("TesterAgent")
+        cls._template_status = GlobalStatus(
             last_action="BUILD",
             last_agent="BuilderAgent",
             last_result="SUCCESS",
@@ -335,6 +628,10 @@ class TestTesterAgent(unittest.TestCase):
             ai_handoff_requested=True
         )
     
+    def setUp(self):
+        """Set up test fixtures"""
+        self.global_status = replace(self._template_status, top_errors=[])
+    
     def test_agent_initialization(self):
         """Test agent initializes correctly"""
         self.assertEqual(self.agent.name, "TesterAgent")
@@ -354,8 +651,7 @@ class TestTesterAgent(unittest.TestCase):
         result = self.agent.execute(self.global_status)
         
         # Verify can be serialized to JSON
-        json_str = json.dumps(result)
-        self.assertIsInstance(json_str, str)
+        _dumps(result)
         
         # Verify test results structure
         self.assertIn("test_results", result)
@@ -375,10 +671,11 @@ class TestFinalizerAgent(unittest.TestCase):
     AI_NOTE: Tests for FinalizerAgent class
     """
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.agent = FinalizerAgent()
-        self.global_status = GlobalStatus(
+    @classmethod
+    def setUpClass(cls):
+        """Fetch the shared agent and build the status template once per class"""
+        cls.agent = get_agent("FinalizerAgent")
+        cls._template_status = GlobalStatus(
             last_action="TEST",
             last_agent="TesterAgent",
             last_result="SUCCESS",
@@ -387,6 +684,10 @@ class TestFinalizerAgent(unittest.TestCase):
             ai_handoff_requested=True
         )
     
+    def setUp(self):
+        """Set up test fixtures"""
+        self.global_status = replace(self._template_status, top_errors=[])
+    
     def test_agent_initialization(self):
         """Test agent initializes correctly"""
         self.assertEqual(self.agent.name, "FinalizerAgent")
@@ -426,10 +727,11 @@ class TestBuilderAgent(unittest.TestCase):
     AI_NOTE: Tests for BuilderAgent class
     """
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.agent = BuilderAgent()
-        self.global_status = GlobalStatus(
+    @classmethod
+    def setUpClass(cls):
+        """Fetch the shared agent and build the status template once per class"""
+        cls.agent = get_agent("BuilderAgent")
+        cls._template_status = GlobalStatus(
             last_action="INIT",
             last_agent="SYSTEM",
             last_result="SUCCESS",
@@ -438,6 +740,10 @@ class TestBuilderAgent(unittest.TestCase):
             ai_handoff_requested=False
         )
     
+    def setUp(self):
+        """Set up test fixtures"""
+        self.global_status = replace(self._template_status, top_errors=[])
+    
     def test_agent_initialization(self):
         """Test agent initializes correctly"""
         self.assertEqual(self.agent.name, "BuilderAgent")
@@ -453,22 +759,28 @@ class TestBuilderAgent(unittest.TestCase):
         self.assertIn("build_success_rate", result)
 
 
+# Test classes run by run_tests(), in order
+_TEST_CLASSES = (
+    TestGlobalStatus,
+    TestSMCCoordinator,
+    TestReasoningAgent,
+    TestTesterAgent,
+    TestFinalizerAgent,
+    TestBuilderAgent
+)
+
+# Shared runner; each run() creates its own result object
+_RUNNER = unittest.TextTestRunner(verbosity=2)
+
+
 def run_tests():
     """Run all tests"""
     loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add all test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestGlobalStatus))
-    suite.addTests(loader.loadTestsFromTestCase(TestSMCCoordinator))
-    suite.addTests(loader.loadTestsFromTestCase(TestReasoningAgent))
-    suite.addTests(loader.loadTestsFromTestCase(TestTesterAgent))
-    suite.addTests(loader.loadTestsFromTestCase(TestFinalizerAgent))
-    suite.addTests(loader.loadTestsFromTestCase(TestBuilderAgent))
+    # Suites empty themselves as they run, so each call loads a fresh one
+    suite = unittest.TestSuite(map(loader.loadTestsFromTestCase, _TEST_CLASSES))
     
     # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    result = _RUNNER.run(suite)
     
     return 0 if result.wasSuccessful() else 1
 